@@ -3,7 +3,7 @@
 Vault CLI - A command-line tool for AI agents to interact with Obsidian vaults.
 
 Usage:
-    vault-cli search <query> [--max-results N] [--context-length N]
+    vault-cli search <query> [--max-results N] [--context-length N] [--fetch N]
     vault-cli get <path> [--metadata-only] [--max-chars N]
     vault-cli list [<path>]
     vault-cli create <path> --content <content>
@@ -16,39 +16,255 @@ Usage:
     vault-cli patch <path> --block <ref> --operation <op> --content <content>
     vault-cli daily [--content <content>] [--date YYYY-MM-DD] [--period daily|weekly|monthly]
     vault-cli delete <path>
+    vault-cli batch < commands.ndjson
 
 Environment:
     OBSIDIAN_API_KEY - Required. Your Obsidian Local REST API key.
     OBSIDIAN_API_URL - Optional. Default: https://127.0.0.1:27124
+    XDG_CACHE_HOME   - Optional. Responses of get/list are cached in
+                       $XDG_CACHE_HOME/vault-cli/ (default: ~/.cache/vault-cli/).
+    VAULT_CLI_NO_CACHE - Optional. Set to any non-empty value to disable the cache.
 """
 
-import argparse
+import _thread
+import contextlib
+import functools
 import json
 import os
+import string
 import ssl
+import stat
 import sys
-import urllib.error
+import time
+from itertools import islice
+from typing import BinaryIO, Union
 import urllib.parse
-import urllib.request
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to parsing the full body
+    ijson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    
+    def _dumps(obj, indent: bool = True) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode('utf-8')
+else:
+    _loads = json.loads
+    
+    def _dumps(obj, indent: bool = True) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+# Responses at least this large (or of unknown length) are parsed incrementally
+STREAM_THRESHOLD = 16 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Longest search snippet returned by the search command
+SNIPPET_MAX_CHARS = 200
+
+# SSL context that doesn't verify (for self-signed cert). Unlike
+# ssl.create_default_context() it never loads the system CA bundle.
+_SSL_CTX = ssl._create_unverified_context()
+
+# Characters urllib.parse.quote never encodes
+_UNRESERVED = frozenset(string.ascii_letters + string.digits + '_.-~')
+
+
+@functools.lru_cache(maxsize=4096)
+def quote_path(path: str) -> str:
+    """Percent-encode a vault path as a single URL path segment.
+    
+    Same result as urllib.parse.quote(path, safe=''), memoized and skipping the
+    encoder entirely for plain names.
+    """
+    if _UNRESERVED.issuperset(path):
+        return path
+    return urllib.parse.quote(path, safe='')
+
+
+# Cached responses older than this, or beyond this total size, are evicted
+CACHE_MAX_AGE = 7 * 24 * 3600
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_cache_path() -> str:
+    """Path of the response cache database under $XDG_CACHE_HOME."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'vault-cli', 'cache.sqlite3')
+
+
+class ResponseCache:
+    """On-disk cache of GET response bodies keyed by URL, validated by ETag.
+    
+    The database is opened, and sqlite3 imported, on first use. Any sqlite
+    error disables the cache for the rest of the run instead of failing the
+    request. Entries older than `max_age` seconds are dropped, then the oldest
+    ones until the bodies fit in `max_bytes`.
+    """
+    
+    def __init__(self, db_path: str, max_age: float = CACHE_MAX_AGE,
+                 max_bytes: int = CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._disabled = False
+        # The connection is shared by the thread pool in search_and_fetch.
+        # _thread is built in, unlike threading which would be imported on every run
+        self._lock = _thread.allocate_lock()
+    
+    def _connect(self):
+        import sqlite3
+        
+        if self._conn is None and not self._disabled:
+            try:
+                os.makedirs(os.path.dirname(self.db_path), mode=0o700, exist_ok=True)
+                # Note bodies are private; create the file owner-only before sqlite opens it
+                os.close(os.open(self.db_path, os.O_CREAT | os.O_WRONLY, 0o600))
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._conn.execute('CREATE TABLE IF NOT EXISTS cache '
+                                   '(path TEXT PRIMARY KEY, etag TEXT, body BLOB, ts REAL)')
+            except (OSError, sqlite3.Error):
+                self._disabled = True
+                self._conn = None
+        return self._conn
+    
+    def get(self, path: str):
+        """Return (etag, body) cached for path, or None."""
+        import sqlite3
+        
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                return conn.execute('SELECT etag, body FROM cache WHERE path = ?',
+                                    (path,)).fetchone()
+            except sqlite3.Error:
+                self._disabled = True
+                return None
+    
+    def put(self, path: str, etag: str, body: bytes):
+        """Store the body and ETag for path."""
+        self._execute('INSERT OR REPLACE INTO cache (path, etag, body, ts) VALUES (?, ?, ?, ?)',
+                      (path, etag, body, time.time()))
+        self._evict()
+    
+    def invalidate(self, path: str):
+        """Drop any cached body for path."""
+        self._execute('DELETE FROM cache WHERE path = ?', (path,))
+    
+    def _evict(self):
+        """Drop expired entries, then the oldest ones beyond max_bytes."""
+        import sqlite3
+        
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute('DELETE FROM cache WHERE ts < ?', (time.time() - self.max_age,))
+                    total = 0
+                    stale = []
+                    for path, size in conn.execute(
+                            'SELECT path, length(body) FROM cache ORDER BY ts DESC'):
+                        total += size or 0
+                        if total > self.max_bytes:
+                            stale.append((path,))
+                    conn.executemany('DELETE FROM cache WHERE path = ?', stale)
+            except sqlite3.Error:
+                self._disabled = True
+    
+    def _execute(self, sql: str, args: tuple):
+        import sqlite3
+        
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(sql, args)
+            except sqlite3.Error:
+                self._disabled = True
+
+
+class _TeeReader:
+    """File-like wrapper keeping a copy of everything read through it."""
+    
+    def __init__(self, response):
+        self._response = response
+        self.chunks = []
+    
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._response.read(size)
+        self.chunks.append(chunk)
+        return chunk
 
 
 class VaultClient:
     """HTTP client for Obsidian Local REST API."""
     
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(self, base_url: str, api_key: str, cache: ResponseCache = None):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
-        # Create SSL context that doesn't verify (for self-signed cert)
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.check_hostname = False
-        self.ssl_context.verify_mode = ssl.CERT_NONE
-    
-    def _request(self, method: str, path: str, data: bytes = None, 
-                 headers: dict = None, content_type: str = None) -> dict:
-        """Make HTTP request to the API."""
-        url = f"{self.base_url}{path}"
+        self.cache = cache
+        self.ssl_context = _SSL_CTX
+        
+        parts = urllib.parse.urlsplit(self.base_url)
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self._base_path = parts.path
+        # Compression only pays off off-host; loopback transfers are not bandwidth-bound
+        self._compress = self._host not in ('127.0.0.1', 'localhost', '::1')
         
+        # Keep-alive connection pool, set up by enable_pooling()
+        self._pool = None
+    
+    def enable_pooling(self):
+        """Reuse keep-alive connections for all further requests (requires urllib3).
+        
+        Only worth it when several requests are made: urllib3 is slow to import,
+        so single commands stay on urllib.request.
+        """
+        if self._pool is not None:
+            return
+        try:
+            import urllib3
+        except ImportError:  # urllib3 is optional; keep using urllib.request
+            return
+        # Retry only on server errors; a refused connection fails at once
+        retries = urllib3.Retry(3, connect=0, backoff_factor=0.1, raise_on_status=False,
+                                status_forcelist=[502, 503, 504])
+        if self._scheme == 'https':
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            self._pool = urllib3.HTTPSConnectionPool(
+                self._host, self._port, maxsize=8, ssl_context=self.ssl_context,
+                cert_reqs='CERT_NONE', assert_hostname=False, retries=retries)
+        else:
+            self._pool = urllib3.HTTPConnectionPool(
+                self._host, self._port, maxsize=8, retries=retries)
+    
+    def _request(self, method: str, path: str, data: Union[bytes, BinaryIO] = None, 
+                 headers: dict = None, content_type: str = None, stream=None,
+                 cached: bool = False) -> dict:
+        """Make HTTP request to the API.
+        
+        If `stream` is given, it is called with the response file object to parse
+        large JSON bodies incrementally (requires ijson) instead of reading them fully.
+        `data` may be an open binary file, which is sent in chunks as it is read.
+        If `cached` is set and the client has a cache, the request is revalidated
+        with If-None-Match and a 304 is answered from the cached body.
+        """
         req_headers = {
             'Authorization': f'Bearer {self.api_key}',
         }
@@ -56,39 +272,236 @@ class VaultClient:
             req_headers.update(headers)
         if content_type:
             req_headers['Content-Type'] = content_type
+        if data is not None and not isinstance(data, bytes):
+            req_headers['Content-Length'] = str(os.fstat(data.fileno()).st_size - data.tell())
+        if self._compress:
+            req_headers['Accept-Encoding'] = 'gzip'
+        
+        cache_key = f"{self.base_url}{path}" if cached and self.cache is not None else None
+        cache_entry = self.cache.get(cache_key) if cache_key else None
+        if cache_entry:
+            req_headers['If-None-Match'] = cache_entry[0]
+        
+        if self._pool is not None:
+            return self._pool_request(method, path, data, req_headers, stream,
+                                      cache_key, cache_entry)
         
+        import urllib.error
+        import urllib.request
+        
+        url = f"{self.base_url}{path}"
         request = urllib.request.Request(url, data=data, headers=req_headers, method=method)
         
         try:
             with urllib.request.urlopen(request, context=self.ssl_context) as response:
-                content = response.read()
-                if content:
-                    # Try to parse as JSON
-                    try:
-                        return {'ok': True, 'data': json.loads(content.decode('utf-8'))}
-                    except json.JSONDecodeError:
-                        return {'ok': True, 'data': content.decode('utf-8')}
-                return {'ok': True, 'data': None}
+                return self._handle_response(response, response.status, response.reason,
+                                             stream, cache_key, cache_entry)
         except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8') if e.fp else ''
-            try:
-                error_data = json.loads(error_body)
-                return {'ok': False, 'error': error_data.get('message', str(e)), 'code': e.code}
-            except:
-                return {'ok': False, 'error': str(e), 'code': e.code}
+            # urllib raises for 304 Not Modified as well as for real errors
+            return self._handle_response(e, e.code, e.reason, stream,
+                                         cache_key, cache_entry)
         except urllib.error.URLError as e:
             return {'ok': False, 'error': f"Connection failed: {e.reason}"}
     
-    def search(self, query: str, context_length: int = 100) -> dict:
-        """Search for notes matching query."""
+    def _pool_request(self, method: str, path: str, data: Union[bytes, BinaryIO],
+                      req_headers: dict,
+                      stream=None, cache_key: str = None,
+                      cache_entry: tuple = None) -> dict:
+        """Make HTTP request over the pooled keep-alive connection."""
+        import urllib3
+        
+        try:
+            response = self._pool.urlopen(method, f"{self._base_path}{path}", body=data,
+                                          headers=req_headers, preload_content=False)
+        except urllib3.exceptions.HTTPError as e:
+            return {'ok': False, 'error': f"Connection failed: {getattr(e, 'reason', None) or e}"}
+        try:
+            return self._handle_response(response, response.status, response.reason,
+                                         stream, cache_key, cache_entry)
+        finally:
+            # Discard whatever the parser left unread so the socket can be reused
+            response.drain_conn()
+            response.release_conn()
+    
+    def _handle_response(self, response, status: int, reason: str, stream,
+                         cache_key: str, cache_entry: tuple) -> dict:
+        """Build the result dict from a file-like response with the given status."""
+        if status == 304 and cache_entry:
+            return self._success(cache_entry[1])
+        if status >= 400:
+            return self._error(self._read(response), f"HTTP Error {status}: {reason}", status)
+        
+        etag = response.headers.get('ETag') if cache_key else None
+        if self._should_stream(response, stream):
+            if not etag:
+                return self._stream_success(response, stream)
+            # Keep a copy of the streamed bytes for the cache
+            tee = _TeeReader(response)
+            result = self._stream_success(tee, stream)
+            if result['ok']:
+                tee.read()
+                self.cache.put(cache_key, etag, b''.join(tee.chunks))
+            return result
+        content = self._read(response)
+        if etag:
+            self.cache.put(cache_key, etag, content)
+        return self._success(content)
+    
+    def _invalidate(self, path: str):
+        """Drop cached responses for a request path after it was modified."""
+        if self.cache is not None:
+            self.cache.invalidate(f"{self.base_url}{path}")
+    
+    def _read(self, response) -> bytes:
+        """Read the whole response body, decompressing it if needed.
+        
+        urllib3 decodes Content-Encoding itself; urllib.request does not.
+        """
+        content = response.read()
+        encoding = response.headers.get('Content-Encoding') if self._pool is None else None
+        if encoding == 'gzip':
+            import gzip
+            content = gzip.decompress(content)
+        return content
+    
+    def _should_stream(self, response, stream) -> bool:
+        """Whether to parse the response incrementally instead of reading it fully."""
+        if stream is None or ijson is None:
+            return False
+        if self._pool is None and response.headers.get('Content-Encoding'):
+            return False
+        length = response.headers.get('Content-Length')
+        return length is None or int(length) >= STREAM_THRESHOLD
+    
+    @staticmethod
+    def _stream_success(response, stream) -> dict:
+        """Build the result dict by parsing the response body incrementally."""
+        try:
+            return {'ok': True, 'data': stream(response)}
+        except ijson.JSONError as e:
+            return {'ok': False, 'error': f'Invalid JSON response: {e}'}
+    
+    @staticmethod
+    def _success(content: bytes) -> dict:
+        """Build the result dict for a successful response body."""
+        if content:
+            # Try to parse as JSON
+            try:
+                return {'ok': True, 'data': _loads(content)}
+            except ValueError:
+                return {'ok': True, 'data': content.decode('utf-8')}
+        return {'ok': True, 'data': None}
+    
+    @staticmethod
+    def _error(content: bytes, message: str, code: int) -> dict:
+        """Build the result dict for an HTTP error response body."""
+        try:
+            error_data = _loads(content)
+            return {'ok': False, 'error': error_data.get('message', message), 'code': code}
+        except:
+            return {'ok': False, 'error': message, 'code': code}
+    
+    def search(self, query: str, context_length: int = 100, limit: int = None) -> dict:
+        """Search for notes matching query, keeping at most `limit` results."""
         params = urllib.parse.urlencode({'query': query, 'contextLength': context_length})
-        return self._request('POST', f'/search/simple/?{params}')
+        
+        def stream(response):
+            items = ijson.items(response, 'item', use_float=True, buf_size=STREAM_CHUNK_SIZE)
+            return list(islice(items, limit))
+        
+        return self._request('POST', f'/search/simple/?{params}', stream=stream)
+    
+    def search_and_fetch(self, query: str, n: int, context_length: int = 100) -> dict:
+        """Search, then fetch the top N matching notes concurrently.
+        
+        Each of the top N search results gets a 'note' key holding the note data,
+        or the error result if fetching it failed.
+        """
+        # aiohttp and asyncio are slow to import, so only load them when needed
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:  # aiohttp is optional; fall back to a thread pool
+            pass
+        else:
+            import asyncio
+            return asyncio.run(self._asearch_and_fetch(query, n, context_length))
+        
+        from concurrent.futures import ThreadPoolExecutor
+        self.enable_pooling()
+        result = self.search(query, context_length)
+        if result['ok'] and isinstance(result['data'], list) and n > 0:
+            items = result['data'][:n]
+            with ThreadPoolExecutor(max_workers=min(len(items), 8) or 1) as executor:
+                notes = executor.map(lambda item: self.get_note(item.get('filename', '')), items)
+                for item, note in zip(items, notes):
+                    item['note'] = note['data'] if note['ok'] else note
+        return result
+    
+    async def _asearch_and_fetch(self, query: str, n: int, context_length: int) -> dict:
+        """Async search_and_fetch sharing one aiohttp session for all requests."""
+        import asyncio
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(limit=16, ssl=self.ssl_context)
+        session = aiohttp.ClientSession(connector=connector)
+        try:
+            params = urllib.parse.urlencode({'query': query, 'contextLength': context_length})
+            result = await self._arequest(session, 'POST', f'/search/simple/?{params}')
+            if result['ok'] and isinstance(result['data'], list) and n > 0:
+                items = result['data'][:n]
+                headers = {'Accept': 'application/vnd.olrapi.note+json'}
+                notes = await asyncio.gather(*(
+                    self._arequest(session, 'GET',
+                                   f"/vault/{quote_path(item.get('filename', ''))}",
+                                   headers=headers)
+                    for item in items
+                ))
+                for item, note in zip(items, notes):
+                    item['note'] = note['data'] if note['ok'] else note
+            return result
+        finally:
+            await session.close()
+    
+    async def _arequest(self, session, method: str, path: str, headers: dict = None) -> dict:
+        """Make HTTP request to the API with an aiohttp session."""
+        import asyncio
+        import aiohttp
+        
+        req_headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            # aiohttp asks for gzip and deflate by default; match _request instead
+            'Accept-Encoding': 'gzip' if self._compress else 'identity',
+        }
+        if headers:
+            req_headers.update(headers)
+        
+        try:
+            async with session.request(method, f"{self.base_url}{path}",
+                                       headers=req_headers) as response:
+                content = await response.read()
+                if response.status >= 400:
+                    return self._error(content, f"HTTP Error {response.status}: {response.reason}",
+                                       response.status)
+                return self._success(content)
+        except aiohttp.ClientError as e:
+            return {'ok': False, 'error': f"Connection failed: {e}"}
+        except asyncio.TimeoutError:
+            return {'ok': False, 'error': 'Connection failed: request timed out'}
     
     def get_note(self, path: str, metadata_only: bool = False) -> dict:
         """Get note content and/or metadata."""
-        encoded_path = urllib.parse.quote(path, safe='')
+        encoded_path = quote_path(path)
         headers = {'Accept': 'application/vnd.olrapi.note+json'}
-        result = self._request('GET', f'/vault/{encoded_path}', headers=headers)
+        stream = None
+        if metadata_only:
+            # kvitems still decodes the content string before it is dropped; streaming
+            # only avoids holding the raw body in memory next to the parsed note
+            def stream(response):
+                items = ijson.kvitems(response, '', use_float=True, buf_size=STREAM_CHUNK_SIZE)
+                return {key: value for key, value in items if key != 'content'}
+        # Metadata-only requests are streamed rather than cached
+        result = self._request('GET', f'/vault/{encoded_path}', headers=headers, stream=stream,
+                               cached=not metadata_only)
         
         if result['ok'] and metadata_only and isinstance(result['data'], dict):
             # Remove content for metadata-only requests
@@ -98,34 +511,40 @@ class VaultClient:
     
     def list_dir(self, path: str = '') -> dict:
         """List directory contents."""
+        def stream(response):
+            return dict(ijson.kvitems(response, '', use_float=True, buf_size=STREAM_CHUNK_SIZE))
+        
         if path:
-            encoded_path = urllib.parse.quote(path.rstrip('/'), safe='') + '/'
-            return self._request('GET', f'/vault/{encoded_path}')
-        return self._request('GET', '/vault/')
-    
-    def create_note(self, path: str, content: str) -> dict:
-        """Create a new note."""
-        encoded_path = urllib.parse.quote(path, safe='')
+            encoded_path = quote_path(path.rstrip('/')) + '/'
+            return self._request('GET', f'/vault/{encoded_path}', stream=stream, cached=True)
+        return self._request('GET', '/vault/', stream=stream, cached=True)
+    
+    def create_note(self, path: str, content: Union[str, BinaryIO]) -> dict:
+        """Create a new note from text or an open binary file."""
+        encoded_path = quote_path(path)
+        self._invalidate(f'/vault/{encoded_path}')
         return self._request('PUT', f'/vault/{encoded_path}', 
-                           data=content.encode('utf-8'),
+                           data=content.encode('utf-8') if isinstance(content, str) else content,
                            content_type='text/markdown')
     
-    def append_note(self, path: str, content: str) -> dict:
-        """Append content to a note."""
-        encoded_path = urllib.parse.quote(path, safe='')
+    def append_note(self, path: str, content: Union[str, BinaryIO]) -> dict:
+        """Append text or an open binary file's content to a note."""
+        encoded_path = quote_path(path)
+        self._invalidate(f'/vault/{encoded_path}')
         return self._request('POST', f'/vault/{encoded_path}',
-                           data=content.encode('utf-8'),
+                           data=content.encode('utf-8') if isinstance(content, str) else content,
                            content_type='text/markdown')
     
     def patch_note(self, path: str, target_type: str, target: str, 
                    operation: str, content: str, content_type: str = 'text/markdown') -> dict:
         """Patch a note at a specific location."""
-        encoded_path = urllib.parse.quote(path, safe='')
+        encoded_path = quote_path(path)
         headers = {
             'Operation': operation,
             'Target-Type': target_type,
             'Target': target,
         }
+        self._invalidate(f'/vault/{encoded_path}')
         return self._request('PATCH', f'/vault/{encoded_path}',
                            data=content.encode('utf-8'),
                            headers=headers,
@@ -145,11 +564,302 @@ class VaultClient:
     
     def delete_note(self, path: str) -> dict:
         """Delete a note."""
-        encoded_path = urllib.parse.quote(path, safe='')
+        encoded_path = quote_path(path)
+        self._invalidate(f'/vault/{encoded_path}')
         return self._request('DELETE', f'/vault/{encoded_path}')
 
 
-def main():
+def get_content(params: dict) -> str:
+    """Get content from the content, stdin or file parameter."""
+    if params.get('content'):
+        return params['content']
+    if params.get('stdin'):
+        return sys.stdin.read()
+    if params.get('file'):
+        with open(params['file'], 'r', encoding='utf-8') as f:
+            return f.read()
+    return ''
+
+
+def open_content(params: dict):
+    """Context manager yielding the content, with a file opened in binary mode.
+    
+    Regular files are passed on as-is so the HTTP layer streams them instead of
+    reading them into memory first. Pipes and devices have no size to send as
+    Content-Length and can't be rewound for retries, so they are read as bytes.
+    """
+    if params.get('file') and not params.get('content') and not params.get('stdin'):
+        f = open(params['file'], 'rb')
+        if stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+            return f
+        with f:
+            return contextlib.nullcontext(f.read())
+    return contextlib.nullcontext(get_content(params))
+
+
+def do_search(client: VaultClient, params: dict) -> dict:
+    """Search notes and simplify results for token efficiency."""
+    # Snippets are cut to SNIPPET_MAX_CHARS, so don't ask the server for more context
+    context_length = min(params.get('context_length', 100), SNIPPET_MAX_CHARS)
+    max_results = params.get('max_results', 10)
+    if params.get('fetch'):
+        # Notes beyond max_results would be dropped below, so don't fetch them
+        result = client.search_and_fetch(params['query'], min(params['fetch'], max_results),
+                                          context_length)
+    else:
+        result = client.search(params['query'], context_length, max_results)
+    if result['ok'] and isinstance(result['data'], list):
+        # Limit results
+        result['data'] = result['data'][:max_results]
+        # Simplify output for token efficiency
+        simplified = []
+        for item in result['data']:
+            entry = {
+                'path': item.get('filename', ''),
+                'score': item.get('score', 0),
+            }
+            matches = item.get('matches', [])
+            if matches:
+                entry['snippets'] = [m.get('context', '')[:SNIPPET_MAX_CHARS]
+                                     for m in matches[:3]]
+            if 'note' in item:
+                entry['note'] = item['note']
+            simplified.append(entry)
+        result['data'] = simplified
+    return result
+
+
+def do_get(client: VaultClient, params: dict) -> dict:
+    """Get a note, optionally truncating its content."""
+    max_chars = params.get('max_chars')
+    result = client.get_note(params['path'], params.get('metadata_only', False))
+    if result['ok'] and max_chars and isinstance(result['data'], dict):
+        content = result['data'].get('content', '')
+        if len(content) > max_chars:
+            result['data']['content'] = content[:max_chars] + '\n...[truncated]'
+    return result
+
+
+def do_list(client: VaultClient, params: dict) -> dict:
+    """List directory contents."""
+    return client.list_dir(params.get('path', ''))
+
+
+def do_create(client: VaultClient, params: dict) -> dict:
+    """Create a new note."""
+    with open_content(params) as content:
+        result = client.create_note(params['path'], content)
+    if result['ok']:
+        result['data'] = {'created': params['path']}
+    return result
+
+
+def do_append(client: VaultClient, params: dict) -> dict:
+    """Append content to a note."""
+    with open_content(params) as content:
+        result = client.append_note(params['path'], content)
+    if result['ok']:
+        result['data'] = {'appended_to': params['path']}
+    return result
+
+
+def do_patch(client: VaultClient, params: dict) -> dict:
+    """Patch a note at a heading, frontmatter field or block."""
+    content = get_content(params)
+    if params.get('heading'):
+        target_type, target = 'heading', params['heading']
+    elif params.get('frontmatter'):
+        target_type, target = 'frontmatter', params['frontmatter']
+    elif params.get('block'):
+        target_type, target = 'block', params['block']
+    else:
+        return {'ok': False, 'error': 'One of heading, frontmatter or block is required'}
+    
+    # Use JSON content type for frontmatter
+    content_type = 'application/json' if target_type == 'frontmatter' else 'text/markdown'
+    result = client.patch_note(params['path'], target_type, target,
+                               params['operation'], content, content_type)
+    if result['ok']:
+        result['data'] = {'patched': params['path'], 'target': target}
+    return result
+
+
+def do_daily(client: VaultClient, params: dict) -> dict:
+    """Append to a periodic note."""
+    content = get_content(params)
+    period = params.get('period', 'daily')
+    date = params.get('date')
+    if date:
+        from datetime import datetime
+        try:
+            dt = datetime.strptime(date, '%Y-%m-%d')
+        except ValueError:
+            return {'ok': False, 'error': f'Invalid date format: {date}. Use YYYY-MM-DD'}
+        result = client.daily_append(content, period, dt.year, dt.month, dt.day)
+    else:
+        result = client.daily_append(content, period)
+    if result['ok']:
+        result['data'] = {'appended_to': f'{period} note'}
+    return result
+
+
+def do_delete(client: VaultClient, params: dict) -> dict:
+    """Delete a note."""
+    result = client.delete_note(params['path'])
+    if result['ok']:
+        result['data'] = {'deleted': params['path']}
+    return result
+
+
+COMMANDS = {
+    'search': do_search,
+    'get': do_get,
+    'list': do_list,
+    'create': do_create,
+    'append': do_append,
+    'patch': do_patch,
+    'daily': do_daily,
+    'delete': do_delete,
+}
+
+
+# Expected types of batch command parameters, checked like argparse does for the CLI
+BATCH_PARAM_TYPES = {
+    'max_results': int, 'context_length': int, 'fetch': int, 'max_chars': int,
+    'metadata_only': bool, 'stdin': bool,
+    'query': str, 'path': str, 'content': str, 'file': str, 'heading': str,
+    'frontmatter': str, 'block': str, 'operation': str, 'date': str, 'period': str,
+}
+
+
+def check_batch_params(params) -> str:
+    """Return an error message if a batch command is malformed, else None."""
+    if not isinstance(params, dict):
+        return 'Invalid command line: expected a JSON object'
+    command = params.get('command')
+    if not isinstance(command, str) or command not in COMMANDS:
+        return f'Unknown command: {command}'
+    for key, kind in BATCH_PARAM_TYPES.items():
+        value = params.get(key)
+        # bool is a subclass of int, but true/false is not a valid count
+        if value is not None and (not isinstance(value, kind)
+                                  or (kind is int and isinstance(value, bool))):
+            return f'Invalid parameter {key}: expected {kind.__name__}'
+    return None
+
+
+def run_batch(client: VaultClient, lines) -> bool:
+    """Run NDJSON commands over one client, writing one NDJSON result per line.
+    
+    Each line is an object such as {"command": "get", "path": "note.md"} whose
+    keys match the long option names of the command (e.g. "max_results").
+    Returns True if every command succeeded.
+    """
+    all_ok = True
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            params = _loads(line)
+            error = check_batch_params(params)
+            if error:
+                result = {'ok': False, 'error': error}
+            elif params.get('stdin'):
+                result = {'ok': False, 'error': 'stdin content is not supported in batch mode'}
+            else:
+                result = COMMANDS[params['command']](client, params)
+        except (ValueError, AttributeError, TypeError) as e:
+            result = {'ok': False, 'error': f'Invalid command line: {e}'}
+        except KeyError as e:
+            result = {'ok': False, 'error': f'Missing parameter: {e.args[0]}'}
+        except OSError as e:
+            result = {'ok': False, 'error': str(e)}
+        all_ok = all_ok and result.get('ok', False)
+        sys.stdout.write(_dumps(result, indent=False) + '\n')
+        sys.stdout.flush()
+    return all_ok
+
+
+# Options of the hot commands, parsed by parse_fast_args without argparse.
+# Each option maps to (destination, type); a type of None marks a flag.
+FAST_COMMANDS = {
+    'search': {
+        'positionals': ['query'],
+        'options': {
+            '--max-results': ('max_results', int), '-n': ('max_results', int),
+            '--context-length': ('context_length', int), '-c': ('context_length', int),
+            '--fetch': ('fetch', int),
+        },
+        'defaults': {'max_results': 10, 'context_length': 100, 'fetch': None},
+    },
+    'get': {
+        'positionals': ['path'],
+        'options': {
+            '--metadata-only': ('metadata_only', None), '-m': ('metadata_only', None),
+            '--max-chars': ('max_chars', int),
+        },
+        'defaults': {'metadata_only': False, 'max_chars': None},
+    },
+    'list': {
+        'positionals': ['path'],
+        'options': {},
+        'defaults': {'path': ''},
+    },
+}
+
+
+def parse_fast_args(argv: list):
+    """Parse search/get/list arguments without building the argparse parser.
+    
+    Returns the params dict, or None for anything not handled here (other
+    commands, -h, unknown options, bad values) so argparse can parse it and
+    report errors instead.
+    """
+    if not argv or argv[0] not in FAST_COMMANDS:
+        return None
+    spec = FAST_COMMANDS[argv[0]]
+    params = dict(spec['defaults'], command=argv[0])
+    positionals = []
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg.startswith('-') and arg != '-':
+            name, sep, value = arg.partition('=')
+            if name not in spec['options']:
+                return None
+            dest, kind = spec['options'][name]
+            if kind is None:
+                if sep:
+                    return None
+                params[dest] = True
+            else:
+                if not sep:
+                    i += 1
+                    if i == len(argv):
+                        return None
+                    value = argv[i]
+                try:
+                    params[dest] = kind(value)
+                except ValueError:
+                    return None
+        else:
+            positionals.append(arg)
+        i += 1
+    
+    names = spec['positionals']
+    if len(positionals) > len(names):
+        return None
+    params.update(zip(names, positionals))
+    if any(name not in params for name in names):
+        return None
+    return params
+
+
+def build_parser():
+    """Build the full argparse parser, used for --help and all other commands."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Vault CLI - Interact with Obsidian vaults via Local REST API',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -164,6 +874,8 @@ def main():
                                help='Maximum number of results (default: 10)')
     search_parser.add_argument('--context-length', '-c', type=int, default=100,
                                help='Context length around matches (default: 100)')
+    search_parser.add_argument('--fetch', type=int, metavar='N',
+                               help='Also fetch the top N matching notes concurrently')
     
     # Get command
     get_parser = subparsers.add_parser('get', help='Get note content')
@@ -223,11 +935,21 @@ def main():
     delete_parser = subparsers.add_parser('delete', help='Delete a note')
     delete_parser.add_argument('path', help='Path to note')
     
-    args = parser.parse_args()
+    # Batch command
+    subparsers.add_parser('batch', help='Run NDJSON commands from stdin over one connection')
     
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
+    return parser
+
+
+def main():
+    params = parse_fast_args(sys.argv[1:])
+    if params is None:
+        parser = build_parser()
+        args = parser.parse_args()
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
+        params = vars(args)
     
     # Get API key from environment
     api_key = os.environ.get('OBSIDIAN_API_KEY')
@@ -236,98 +958,21 @@ def main():
         sys.exit(1)
     
     base_url = os.environ.get('OBSIDIAN_API_URL', 'https://127.0.0.1:27124')
-    client = VaultClient(base_url, api_key)
-    
-    # Helper to get content from various sources
-    def get_content(args_obj) -> str:
-        if hasattr(args_obj, 'content') and args_obj.content:
-            return args_obj.content
-        if hasattr(args_obj, 'stdin') and args_obj.stdin:
-            return sys.stdin.read()
-        if hasattr(args_obj, 'file') and args_obj.file:
-            with open(args_obj.file, 'r', encoding='utf-8') as f:
-                return f.read()
-        return ''
+    cache = None if os.environ.get('VAULT_CLI_NO_CACHE') else ResponseCache(default_cache_path())
+    client = VaultClient(base_url, api_key, cache)
     
-    # Execute command
-    result = None
-    
-    if args.command == 'search':
-        result = client.search(args.query, args.context_length)
-        if result['ok'] and isinstance(result['data'], list):
-            # Limit results
-            result['data'] = result['data'][:args.max_results]
-            # Simplify output for token efficiency
-            simplified = []
-            for item in result['data']:
-                entry = {
-                    'path': item.get('filename', ''),
-                    'score': item.get('score', 0),
-                }
-                matches = item.get('matches', [])
-                if matches:
-                    entry['snippets'] = [m.get('context', '')[:200] for m in matches[:3]]
-                simplified.append(entry)
-            result['data'] = simplified
-    
-    elif args.command == 'get':
-        result = client.get_note(args.path, args.metadata_only)
-        if result['ok'] and args.max_chars and isinstance(result['data'], dict):
-            content = result['data'].get('content', '')
-            if len(content) > args.max_chars:
-                result['data']['content'] = content[:args.max_chars] + '\n...[truncated]'
-    
-    elif args.command == 'list':
-        result = client.list_dir(args.path)
-    
-    elif args.command == 'create':
-        content = get_content(args)
-        result = client.create_note(args.path, content)
-        if result['ok']:
-            result['data'] = {'created': args.path}
-    
-    elif args.command == 'append':
-        content = get_content(args)
-        result = client.append_note(args.path, content)
-        if result['ok']:
-            result['data'] = {'appended_to': args.path}
-    
-    elif args.command == 'patch':
-        content = get_content(args)
-        if args.heading:
-            target_type, target = 'heading', args.heading
-        elif args.frontmatter:
-            target_type, target = 'frontmatter', args.frontmatter
-        else:
-            target_type, target = 'block', args.block
-        
-        # Use JSON content type for frontmatter
-        content_type = 'application/json' if args.frontmatter else 'text/markdown'
-        result = client.patch_note(args.path, target_type, target, 
-                                  args.operation, content, content_type)
-        if result['ok']:
-            result['data'] = {'patched': args.path, 'target': target}
-    
-    elif args.command == 'daily':
-        content = get_content(args)
-        if args.date:
-            try:
-                dt = datetime.strptime(args.date, '%Y-%m-%d')
-                result = client.daily_append(content, args.period, dt.year, dt.month, dt.day)
-            except ValueError:
-                result = {'ok': False, 'error': f'Invalid date format: {args.date}. Use YYYY-MM-DD'}
-        else:
-            result = client.daily_append(content, args.period)
-        if result and result['ok']:
-            result['data'] = {'appended_to': f'{args.period} note'}
+    if params['command'] == 'batch':
+        client.enable_pooling()
+        sys.exit(0 if run_batch(client, sys.stdin) else 1)
     
-    elif args.command == 'delete':
-        result = client.delete_note(args.path)
-        if result['ok']:
-            result['data'] = {'deleted': args.path}
+    # Execute command
+    try:
+        result = COMMANDS[params['command']](client, params)
+    except OSError as e:
+        result = {'ok': False, 'error': str(e)}
     
     # Output result as JSON
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(_dumps(result))
     sys.exit(0 if result and result.get('ok') else 1)
 
 